@@ -1,5 +1,6 @@
 """Type hinting."""
 
+import functools
 from collections.abc import Callable
 from typing import Any, ParamSpec, TypeVar, get_type_hints
 
@@ -10,6 +11,7 @@ R = TypeVar("R")
 T = TypeVar("T")
 
 
+@functools.cache
 def get_return_type(func: Callable[P, R]) -> type[R]:
     """Get the return type of a function."""
     return get_type_hints(func)["return"]
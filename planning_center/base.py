@@ -3,17 +3,19 @@
 from __future__ import annotations
 
 import abc
+import dataclasses
 import datetime
 import enum
 import functools
 import http
 import inspect
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from types import get_original_bases
 from typing import (
     TYPE_CHECKING,
     Annotated,
     Any,
+    ClassVar,
     Literal,
     NotRequired,
     Self,
@@ -38,6 +40,7 @@ from pydantic import (
     validate_call,
 )
 from pydantic.alias_generators import to_snake
+from pydantic_core import from_json
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pypco import PCO
 
@@ -56,6 +59,11 @@ class _Auth(BaseSettings):
 
 def get_pco(api_base: str = "https://api.planningcenteronline.com") -> PCO:
     """Get the PCO client."""
+    return _get_pco(api_base)
+
+
+@functools.cache
+def _get_pco(api_base: str) -> PCO:
     auth = _Auth()
     return PCO(
         application_id=auth.client_id.get_secret_value(),
@@ -109,13 +117,23 @@ class Response(TypedDict):
 class FrozenModel(BaseModel):
     """A pydantic BaseModel that is immutable."""
 
-    model_config = ConfigDict(frozen=True, validate_default=True, extra="ignore")
+    model_config = ConfigDict(
+        frozen=True,
+        validate_default=True,
+        extra="ignore",
+        defer_build=True,
+    )
+
+
+@functools.cache
+def _get_type_adapter(hint: Any) -> TypeAdapter[Any]:
+    """Get a type adapter for a type hint."""
+    return TypeAdapter(hint)
 
 
 def validate(value: Any, hint: type[T]) -> T:
     """Perform validation on a value according to a type hint."""
-    adapter = TypeAdapter(hint)
-    return adapter.validate_python(value)
+    return _get_type_adapter(hint).validate_python(value)  # type: ignore[arg-type]
 
 
 class ResponseModel(FrozenModel):
@@ -137,6 +155,37 @@ class ResponseModel(FrozenModel):
         return values
 
 
+@functools.cache
+def _get_parameter_names(func: Callable[..., Any]) -> frozenset[str]:
+    """Get the parameter names of a function."""
+    return frozenset(inspect.signature(func).parameters)
+
+
+@functools.cache
+def _get_payload_fields(
+    func: Callable[..., Any],
+) -> tuple[tuple[str, Any, RelationshipInfo | None], ...]:
+    """Get the name, annotation and relationship info of each parameter of a method."""
+    fields = []
+
+    for name, parameter in inspect.signature(func).parameters.items():
+        if (annotation := parameter.annotation) is Relationship:
+            info = RelationshipInfo(type_name=to_PascalCase(name), as_list=False)
+
+        elif (
+            (get_origin(annotation) is Annotated)
+            and (metadata := annotation.__metadata__)
+            and isinstance(first := metadata[0], RelationshipInfo)
+        ):
+            info = first
+        else:
+            info = None
+
+        fields.append((name, annotation, info))
+
+    return tuple(fields)
+
+
 class _BaseCaller[R]:
     def __init__(
         self,
@@ -159,6 +208,14 @@ class _BaseCaller[R]:
             if v is not None
         }
 
+    @functools.cached_property
+    def _include_strings(self) -> tuple[str, ...]:
+        """Names of the included relationships."""
+        if include := self.kwargs.get("include"):
+            return tuple(include.split(","))
+
+        return ()
+
     def _to_json(self, value: Any) -> Any:
         """Convert to a value that can be serialized to JSON."""
         if isinstance(value, list | tuple | set):
@@ -170,6 +227,9 @@ class _BaseCaller[R]:
         if isinstance(value, BaseModel):
             return value.model_dump(by_alias=True, exclude_none=True)
 
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return self._to_json(dataclasses.asdict(value))
+
         if isinstance(value, datetime.date):
             return value.isoformat()
 
@@ -183,28 +243,22 @@ class _BaseCaller[R]:
     def app(self) -> App:
         return self.endpoint._app
 
+    def _request_json(self, method: str, url: str, **params: Any) -> Response:
+        """Make a request and decode the JSON body of the response."""
+        response = self.app._pco.request_response(method, url, **params)
+        return from_json(response.content, cache_strings="all")
+
     @staticmethod
     def _get_next(response: Response) -> str | None:
         return response["links"].get("next")
 
     def _get_response(self) -> Response:
-        url_args: list[str] = []
-
-        for parent in self.endpoint._parents:
-            url_args.extend([parent.endpoint.name, str(parent.id)])
-
-        url_parts = [
-            self.app.name,
-            "v2",
-            *url_args,
-            self.endpoint.name,
-            *[str(arg) for arg in self.args[1:]],
-        ]
+        url_parts = [self.endpoint._path, *[str(arg) for arg in self.args[1:]]]
 
         if not self.root:
             url_parts.append(self.func.__name__)
 
-        return self._call_api((sep := "/") + sep.join(url_parts))
+        return self._call_api("/".join(url_parts))
 
     def _get_id(
         self,
@@ -229,7 +283,7 @@ class _BaseCaller[R]:
             result = response["data"]
 
             if include := response.get("included"):
-                for include_string in self.kwargs["include"].split(","):
+                for include_string in self._include_strings:
                     if isinstance(include, list):
                         if isinstance(
                             item_id := self._get_id(result, include_string),
@@ -264,17 +318,34 @@ class _BaseCaller[R]:
 
         return None
 
-    def run(self: _BaseCaller[R]) -> R:
+    def _iter_pages(
+        self,
+    ) -> Iterator[dict[str, Any] | list[dict[str, Any]] | None]:
+        """Yield the parsed data of each page."""
         response = self._get_response()
-        result = self._parse_response(response)
 
-        if (isinstance(result, list)) and (next_page := self._get_next(response)):
-            while next_page is not None:
-                next_response = self._call_api(next_page)
-                result.extend(
-                    cast(list[dict[str, Any]], self._parse_response(next_response))
-                )
-                next_page = self._get_next(next_response)
+        while True:
+            page = self._parse_response(response)
+            next_page = self._get_next(response) if isinstance(page, list) else None
+
+            # Only the link to the next page is kept while a page is being consumed, so
+            # each page can be freed as soon as its consumer is done with it.
+            del response
+            yield page
+
+            if next_page is None:
+                return
+
+            del page
+            response = self._call_api(next_page)
+
+    def run(self: _BaseCaller[R]) -> R:
+        pages = self._iter_pages()
+        result = next(pages)
+
+        if isinstance(result, list):
+            for page in pages:
+                result.extend(cast(list[dict[str, Any]], page))
 
         # This will be validated by pydantic
         return result  # type: ignore[return-value]
@@ -282,30 +353,37 @@ class _BaseCaller[R]:
 
 @final
 class _GetCaller(_BaseCaller):
-    @property
+    @functools.cached_property
     def query_params(self) -> dict[str, Any]:
-        """Extra query params that are filters."""
+        """Query params of the request, with any filters as `where[...]` params."""
         if (kwargs := self.kwargs) and (
             abstract_method := getattr(Endpoint, self.func.__name__, None)
         ):
+            parameters = _get_parameter_names(abstract_method)
             return {
-                k: v
-                for k, v in kwargs.items()
-                if k not in inspect.signature(abstract_method).parameters
+                (k if k in parameters else f"where[{k}]"): v for k, v in kwargs.items()
             }
 
-        return {}
+        return kwargs
 
     def _call_api(self, url: str) -> Response:
-        query_params = self.query_params
-        payload = {k: v for k, v in self.kwargs.items() if k not in query_params} | {
-            f"where[{k}]": v for k, v in query_params.items()
-        }
+        return self._request_json(http.HTTPMethod.GET, url, **self.query_params)
+
+    def iterate(self) -> Iterator[ResponseModel]:
+        """Yield the validated items of each page, one page at a time."""
+        hint = list[self.endpoint._model]  # type: ignore[name-defined]
 
-        return self.app._pco.get(url, **payload)
+        for page in self._iter_pages():
+            items = validate(page, hint)
+            del page
+            yield from items
 
 
 class _UpdateCaller(_BaseCaller[R]):
+    # Whether the payload attributes still need to be validated, i.e. the method was
+    # not already wrapped in `validate_call` by its `HTTPMethod`.
+    validate_attributes: ClassVar[bool] = True
+
     @property
     def extra_payload_data(self) -> dict[str, Any]:
         return {}
@@ -317,37 +395,28 @@ class _UpdateCaller(_BaseCaller[R]):
         # Determine if any of the kwargs are relationships.
         relationships: dict[str, Any] = {}
 
-        for k, v in inspect.signature(self.func).parameters.items():
-            if (annotation := v.annotation) is Relationship:
-                type_name = to_PascalCase(k)
-                as_list = False
-
-            elif (
-                (get_origin(v.annotation) is Annotated)
-                and (metadata := annotation.__metadata__)
-                and isinstance(first := metadata[0], RelationshipInfo)
-            ):
-                type_name = first.type_name
-                as_list = first.as_list
-            else:
-                type_name = None
-
-                if (annotation is not inspect.Parameter.empty) and (k in kwargs):
-                    kwargs[k] = validate(kwargs[k], annotation)
+        for k, annotation, info in _get_payload_fields(self.func):
+            if info is None:
+                if (
+                    self.validate_attributes
+                    and (annotation is not inspect.Parameter.empty)
+                    and (k in kwargs)
+                ):
+                    kwargs[k] = self._to_json(validate(kwargs[k], annotation))
 
-            if type_name and ((value := kwargs.pop(k, None)) is not None):
+            elif (value := kwargs.pop(k, None)) is not None:
                 relationship_data: DataDict | list[DataDict] = DataDict(
-                    type=type_name,
+                    type=info.type_name,
                     id=cast(int, value),
                 )
 
-                if as_list:
+                if info.as_list:
                     relationship_data = [relationship_data]  # type: ignore[list-item]
 
                 relationships[k] = {"data": relationship_data}
 
         data = {
-            "type": get_args(get_original_bases(type(self.endpoint))[0])[0].__name__,
+            "type": self.endpoint._model.__name__,
             "attributes": kwargs,
         }
 
@@ -360,7 +429,7 @@ class _UpdateCaller(_BaseCaller[R]):
 @final
 class _PostCaller(_UpdateCaller[R]):
     def _call_api(self, url: str) -> Response:
-        return self.app._pco.post(url, self.payload)
+        return self._request_json(http.HTTPMethod.POST, url, payload=self.payload)
 
     @override
     def run(self: _PostCaller[R]) -> R:
@@ -371,13 +440,15 @@ class _PostCaller(_UpdateCaller[R]):
 
 @final
 class _PatchCaller(_UpdateCaller[R]):
+    validate_attributes = False
+
     @property
     @override
     def extra_payload_data(self) -> dict[str, Any]:
         return {"id": self.args[-1]}
 
     def _call_api(self, url: str) -> Response:
-        return self.app._pco.patch(url, self.payload)
+        return self._request_json(http.HTTPMethod.PATCH, url, payload=self.payload)
 
 
 @final
@@ -435,15 +506,50 @@ class HTTPMethod(enum.Enum):
             def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
                 return self.caller(root, func, *args, **kwargs).run()  # type: ignore[arg-type]
 
-            return (
-                validate_call(validate_return=True)(wrapper)
-                if self.validate
-                else wrapper
-            )
+            return _defer_validate_call(wrapper) if self.validate else wrapper
 
         return decorator(_func) if _func else decorator
 
 
+def _defer_validate_call(
+    func: Callable[P, R],
+    *,
+    validate_return: bool = True,
+) -> Callable[P, R]:
+    """Wrap a function with `validate_call`, building the validator on first call."""
+    validated: Callable[P, R] | None = None
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        nonlocal validated
+        if validated is None:
+            validated = validate_call(validate_return=validate_return)(func)
+        return validated(*args, **kwargs)
+
+    return wrapper
+
+
+def _iter_all(
+    func: Callable[..., Any],
+    model: type[ResponseModel],
+) -> Callable[..., Iterator[Any]]:
+    """Create an `iter_all` method from a `list_all` method."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Iterator[Any]:
+        return _GetCaller(True, func, *args, **kwargs).iterate()
+
+    return_type = Iterator[model]  # type: ignore[valid-type]
+    wrapper.__name__ = (name := Endpoint.iter_all.__name__)
+    wrapper.__qualname__ = f"{func.__qualname__.rpartition('.')[0]}.{name}"
+    wrapper.__doc__ = Endpoint.iter_all.__doc__
+    wrapper.__annotations__ = func.__annotations__ | {"return": return_type}
+    wrapper.__signature__ = inspect.signature(func).replace(  # type: ignore[attr-defined]
+        return_annotation=return_type,
+    )
+    return _defer_validate_call(wrapper, validate_return=False)
+
+
 class RelationshipInfo(FrozenModel):
     """Metadata to indicate that an attribute is a relationship."""
 
@@ -486,6 +592,9 @@ type PerPage = Annotated[int, Field(ge=1, le=100)]
 class Endpoint[M](_EndpointBase):
     """Base class for planning center endpoint."""
 
+    _model: ClassVar[type[ResponseModel]]
+    """Response model of the endpoint, resolved once when the subclass is created."""
+
     def __init__(self, app: App, *parents: _Parent) -> None:
         """Initialize endpoint."""
         self._app = app
@@ -493,12 +602,27 @@ class Endpoint[M](_EndpointBase):
 
     def __call__(self, id: int) -> Self:
         """Get an item by id."""
-        self._parents.append(_Parent(endpoint=self, id=id))
-        return self
+        return type(self)(self._app, *self._parents, _Parent(endpoint=self, id=id))
+
+    @functools.cached_property
+    def _path(self) -> str:
+        """URL path of the endpoint, including its parents."""
+        url_parts = [self._app.name, "v2"]
+
+        for parent in self._parents:
+            url_parts.extend([parent.endpoint.name, str(parent.id)])
+
+        url_parts.append(self.name)
+        return (sep := "/") + sep.join(url_parts)
 
     def __init_subclass__(cls) -> None:
         """Decorate certain methods in subclass."""
         super().__init_subclass__()
+        cls._model = get_args(get_original_bases(cls)[0])[0]
+
+        if not getattr(list_all := cls.list_all, "__isabstractmethod__", False):
+            cls.iter_all = _iter_all(list_all, cls._model)  # type: ignore[method-assign]
+
         for method, http_method in [
             (cls.get, HTTPMethod.GET),
             (cls.list_all, HTTPMethod.GET),
@@ -525,6 +649,17 @@ class Endpoint[M](_EndpointBase):
         """List all items."""
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def iter_all(
+        self,
+        include: str | None = None,
+        order: str | None = None,
+        per_page: PerPage = 25,
+        filter: str | None = None,
+    ) -> Iterator[M]:
+        """Iterate over all items, one page at a time."""
+        raise NotImplementedError
+
     @abc.abstractmethod
     def update(self, *args: int, **kwargs: Any) -> M:
         """Update an item."""
@@ -541,31 +676,37 @@ class Endpoint[M](_EndpointBase):
         raise NotImplementedError
 
 
-class endpoint(property):  # noqa: N801
-    """Property that returns an instance of the annotated type."""
+class endpoint(functools.cached_property[Endpoint]):  # noqa: N801
+    """Cached property that returns an instance of the annotated type."""
 
     def __get__(
         self,
         instance: App | Endpoint | None,
-        owner: type[App | Endpoint],
+        owner: type[App | Endpoint] | None = None,
     ) -> Endpoint:
         """Return the app/endpoint type."""
-        if instance:
-            return_type: type[Endpoint] = get_return_type(self.fget)  # type: ignore[arg-type]
-            if isinstance(instance, App):
-                return return_type(instance)
+        if instance is None:
+            return self  # type: ignore[return-value]
 
+        return_type: type[Endpoint] = get_return_type(self.func)
+        if isinstance(instance, App):
+            result = return_type(instance)
+        else:
             # Ensure that the parent endpoint id has been provided.
             parents = instance._parents
-            if not any(isinstance(parent.endpoint, owner) for parent in parents):
+            if not any(
+                isinstance(parent.endpoint, type(instance)) for parent in parents
+            ):
                 message = (
-                    f"Must provide ID for {(name := _to_url_name(owner))} endpoint. "
-                    f"Hint: `.{name}(12345).{_to_url_name(return_type)}`"
+                    f"Must provide ID for {(name := _to_url_name(type(instance)))} "
+                    f"endpoint. Hint: `.{name}(12345).{_to_url_name(return_type)}`"
                 )
                 raise ValueError(message)
 
-            return return_type(instance._app, *parents)
-        return super().__get__(instance, owner)
+            result = return_type(instance._app, *parents)
+
+        instance.__dict__[self.attrname] = result  # type: ignore[index]
+        return result
 
 
 class _Parent(FrozenModel):
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any, TypeVar, cast
+import functools
+from typing import TypeVar, cast
 
 from ._typing import get_return_type
 from .base import App, get_pco
@@ -16,25 +16,19 @@ from .utils import singleton
 A = TypeVar("A", bound=App)
 
 
-class app[A](property):  # noqa: N801
-    """Property that returns an instance of the annotated type."""
+class app[A](functools.cached_property[A]):  # noqa: N801
+    """Cached property that returns an instance of the annotated type."""
 
-    def __init__(
-        self,
-        fget: Callable[[Client], A] | None = None,
-        fset: Callable[[Client, Any], None] | None = None,
-        fdel: Callable[[Client], None] | None = None,
-        doc: str | None = None,
-    ) -> None:
-        """Initialize property."""
-        super().__init__(fget, fset, fdel, doc)
-
-    def __get__(self: app[A], instance: Client | None, owner: type[Client]) -> A:
+    def __get__(self, instance: Client | None, owner: type[Client] | None = None) -> A:
         """Return the app type."""
-        if instance:
-            return_type = cast(type[A], get_return_type(self.fget))  # type: ignore[arg-type]
-            return return_type(instance._pco)  # type: ignore[call-arg]
-        return super().__get__(instance, owner)
+        if instance is None:
+            return self  # type: ignore[return-value]
+
+        return_type = cast(type[A], get_return_type(self.func))
+        result = return_type(instance._pco)  # type: ignore[call-arg]
+
+        instance.__dict__[self.attrname] = result  # type: ignore[index]
+        return result
 
 
 @singleton
@@ -8,6 +8,9 @@ from ..base import Endpoint, PerPage, endpoint
 from .models import GroupType, Resource
 
 
+type ResourceOrder = Literal["name", "-name", "last_updated", "-last_updated"]
+
+
 class Resources(Endpoint[Resource]):
     """Resources endpoint."""
 
@@ -17,12 +20,15 @@ class Resources(Endpoint[Resource]):
     def list_all(
         self,
         *,
-        order: Literal["name", "-name", "last_updated", "-last_updated"] | None = None,
+        order: ResourceOrder | None = None,
         per_page: PerPage = 25,
     ) -> list[Resource]:
         """Get all resources."""
 
 
+type GroupTypeOrder = Literal["name", "position", "-name", "-position"]
+
+
 class GroupTypes(Endpoint[GroupType]):
     """Group types endpoint."""
 
@@ -32,7 +38,7 @@ class GroupTypes(Endpoint[GroupType]):
     def list_all(
         self,
         *,
-        order: Literal["name", "position", "-name", "-position"] | None = None,
+        order: GroupTypeOrder | None = None,
         per_page: PerPage = 25,
     ) -> list[GroupType]:
         """Get all group types."""
@@ -11,6 +11,16 @@ from .models import Group, Membership, Person, Role
 
 
 type MembershipInclude = Literal["person"]
+type MembershipOrder = Literal[
+    "first_name",
+    "joined_at",
+    "last_name",
+    "role",
+    "-first_name",
+    "-joined_at",
+    "-last_name",
+    "-role",
+]
 
 
 class Memberships(Endpoint[Membership]):
@@ -29,17 +39,7 @@ class Memberships(Endpoint[Membership]):
         self,
         *,
         include: MembershipInclude | None = None,
-        order: Literal[
-            "first_name",
-            "joined_at",
-            "last_name",
-            "role",
-            "-first_name",
-            "-joined_at",
-            "-last_name",
-            "-role",
-        ]
-        | None = None,
+        order: MembershipOrder | None = None,
         role: Role | None = None,
         per_page: PerPage = 25,
     ) -> list[Membership]:
@@ -69,6 +69,8 @@ class Memberships(Endpoint[Membership]):
 
 
 type GroupInclude = Literal["enrollment", "group_type", "location"]
+type GroupOrder = Literal["name", "-name"]
+type GroupArchiveStatus = Literal["not_archived", "only", "include"]
 
 
 class Groups(Endpoint[Group]):
@@ -81,8 +83,8 @@ class Groups(Endpoint[Group]):
         self,
         *,
         include: GroupInclude | None = None,
-        order: Literal["name", "-name"] | None = None,
-        archive_status: Literal["not_archived", "only", "include"] | None = None,
+        order: GroupOrder | None = None,
+        archive_status: GroupArchiveStatus | None = None,
         name: str | None = None,
         per_page: PerPage = 25,
     ) -> list[Group]:
@@ -101,6 +103,9 @@ class Groups(Endpoint[Group]):
         """
 
 
+type PersonOrder = Literal["first_name", "last_name", "-first_name", "-last_name"]
+
+
 class People(Endpoint[Person]):
     """People endpoint."""
 
@@ -110,13 +115,7 @@ class People(Endpoint[Person]):
     def list_all(
         self,
         *,
-        order: Literal[
-            "first_name",
-            "last_name",
-            "-first_name",
-            "-last_name",
-        ]
-        | None = None,
+        order: PersonOrder | None = None,
         first_name: str | None = None,
         last_name: str | None = None,
         per_page: PerPage = 25,
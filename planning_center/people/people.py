@@ -52,6 +52,50 @@ class PeopleParams(TypedDict, total=False):
     status: str
 
 
+type PeopleOrder = Literal[
+    "accounting_administrator",
+    "anniversary",
+    "birthdate",
+    "child",
+    "created_at",
+    "first_name",
+    "gender",
+    "given_name",
+    "grade",
+    "graduation_year",
+    "inactivated_at",
+    "last_name",
+    "membership",
+    "middle_name",
+    "nickname",
+    "people_permissions",
+    "remote_id",
+    "site_administrator",
+    "status",
+    "updated_at",
+    "-accounting_administrator",
+    "-anniversary",
+    "-birthdate",
+    "-child",
+    "-created_at",
+    "-first_name",
+    "-gender",
+    "-given",
+    "-grade",
+    "-graduation_year",
+    "-inactivated_at",
+    "-last_name",
+    "-membership",
+    "-middle_name",
+    "-nickname",
+    "-people_permissions",
+    "-remote_id",
+    "-site_administrator",
+    "-status",
+    "-updated_at",
+]
+
+
 class People(Endpoint[Person]):
     """People endpoint."""
 
@@ -62,49 +106,7 @@ class People(Endpoint[Person]):
         self,
         *,
         include: PeopleInclude | None = None,
-        order: Literal[
-            "accounting_administrator",
-            "anniversary",
-            "birthdate",
-            "child",
-            "created_at",
-            "first_name",
-            "gender",
-            "given_name",
-            "grade",
-            "graduation_year",
-            "inactivated_at",
-            "last_name",
-            "membership",
-            "middle_name",
-            "nickname",
-            "people_permissions",
-            "remote_id",
-            "site_administrator",
-            "status",
-            "updated_at",
-            "-accounting_administrator",
-            "-anniversary",
-            "-birthdate",
-            "-child",
-            "-created_at",
-            "-first_name",
-            "-gender",
-            "-given",
-            "-grade",
-            "-graduation_year",
-            "-inactivated_at",
-            "-last_name",
-            "-membership",
-            "-middle_name",
-            "-nickname",
-            "-people_permissions",
-            "-remote_id",
-            "-site_administrator",
-            "-status",
-            "-updated_at",
-        ]
-        | None = None,
+        order: PeopleOrder | None = None,
         per_page: PerPage = 25,
         created_at: datetime.datetime | None = None,
         updated_at: datetime.datetime | None = None,
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
+import dataclasses
 import datetime
-from typing import Annotated, Any, Literal
-
-from pydantic import Field
+from typing import Any, Literal
 
 from ..base import FrozenModel, ResponseModel
 from .ids import (
@@ -49,7 +48,8 @@ class ServiceTypeAttributes(FrozenModel):
     last_plan_from: str
 
 
-class ServiceTypeRelationship(FrozenModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class ServiceTypeRelationship:
     """Service type relationship."""
 
     parent: FolderId | None = None
@@ -71,15 +71,29 @@ type TeamInclude = Literal[
 ]
 
 
-class TeamReminder(FrozenModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class TeamReminder:
     """Team reminder."""
 
     team_id: int
-    value: Annotated[int, Field(ge=0, le=7)]
+
+    value: int
+    """Number of days (0-7) before the time that the reminder is sent."""
+
+    def __post_init__(self) -> None:
+        """Validate the reminder."""
+        for name in ("team_id", "value"):
+            if not isinstance(field_value := getattr(self, name), int):
+                message = f"Reminder {name} must be an int, got {field_value!r}."
+                raise TypeError(message)
+
+        if not 0 <= self.value <= 7:  # noqa: PLR2004
+            message = f"Reminder value must be between 0 and 7, got {self.value}."
+            raise ValueError(message)
 
     def get_team(self, *, include: TeamInclude | None = None) -> Team:
         """Load the team."""
-        return TeamId(id=self.team_id).load(include=include)
+        return TeamId.model_construct(id=self.team_id).load(include=include)
 
 
 type TimeType = Literal["rehearsal", "service", "other"]
@@ -245,7 +259,8 @@ class PlanAttributes(FrozenModel):
     reminders_disabled: bool
 
 
-class PlanRelationship(FrozenModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class PlanRelationship:
     """Plan relationship."""
 
     service_type: ServiceTypeId
@@ -406,6 +421,28 @@ class Person(ResponseModel):
     links: PersonLinks | None = None
 
 
+type RepeatFrequency = Literal[
+    "no_repeat",
+    "every_1",
+    "every_2",
+    "every_3",
+    "every_4",
+    "every_5",
+    "every_6",
+    "every_7",
+    "every_8",
+]
+type RepeatInterval = Literal[
+    "exact_day_of_month",
+    "week_of_month_1",
+    "week_of_month_2",
+    "week_of_month_3",
+    "week_of_month_4",
+    "week_of_month_last",
+]
+type RepeatPeriod = Literal["daily", "weekly", "monthly", "yearly"]
+
+
 class BlockoutAttributes(FrozenModel):
     """Blockout attributes."""
 
@@ -413,29 +450,9 @@ class BlockoutAttributes(FrozenModel):
     group_identifier: str | None
     organization_name: str
     reason: str | None
-    repeat_frequency: Literal[
-        "no_repeat",
-        "every_1",
-        "every_2",
-        "every_3",
-        "every_4",
-        "every_5",
-        "every_6",
-        "every_7",
-        "every_8",
-    ]
-    repeat_interval: (
-        Literal[
-            "exact_day_of_month",
-            "week_of_month_1",
-            "week_of_month_2",
-            "week_of_month_3",
-            "week_of_month_4",
-            "week_of_month_last",
-        ]
-        | None
-    )
-    repeat_period: Literal["daily", "weekly", "monthly", "yearly"] | None
+    repeat_frequency: RepeatFrequency
+    repeat_interval: RepeatInterval | None
+    repeat_period: RepeatPeriod | None
     settings: str | None
     time_zone: str
     created_at: datetime.datetime
@@ -726,7 +743,8 @@ class PersonTeamPositionAssignment(ResponseModel):
     team_position: TeamPosition | None = None
 
 
-class TeamRelationship(FrozenModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class TeamRelationship:
     """Team relationship."""
 
     service_type: ServiceTypeId
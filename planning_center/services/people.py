@@ -18,6 +18,9 @@ from .models import (
 )
 
 
+type DateFilter = Literal["past", "future"]
+
+
 class BlockoutDates(Endpoint[BlockoutDate]):
     """Blockout dates endpoint."""
 
@@ -37,7 +40,7 @@ class Blockouts(Endpoint[Blockout]):
     def list_all(
         self,
         *,
-        filter: Literal["past", "future"] | None = None,
+        filter: DateFilter | None = None,
         per_page: PerPage = 25,
     ) -> list[Blockout]:
         """Get all blockouts for a person."""
@@ -78,7 +81,7 @@ class Schedules(Endpoint[Schedule]):
         self,
         *,
         include: ScheduleInclude | None = None,
-        filter: Literal["past", "future"] | None = None,
+        filter: DateFilter | None = None,
         per_page: PerPage = 25,
     ) -> list[Schedule]:
         """Get all schedules for a person."""
@@ -144,6 +147,16 @@ class SchedulingPreferences(Endpoint[SchedulingPreference]):
 
 
 type PersonInclude = Literal["emails", "tags", "team_leaders"]
+type PersonOrder = Literal[
+    "created_at",
+    "first_name",
+    "last_name",
+    "updated_at",
+    "-created_at",
+    "-first_name",
+    "-last_name",
+    "-updated_at",
+]
 
 
 class People(Endpoint[Person]):
@@ -162,17 +175,7 @@ class People(Endpoint[Person]):
         self,
         *,
         include: PersonInclude | None = None,
-        order: Literal[
-            "created_at",
-            "first_name",
-            "last_name",
-            "updated_at",
-            "-created_at",
-            "-first_name",
-            "-last_name",
-            "-updated_at",
-        ]
-        | None = None,
+        order: PersonOrder | None = None,
         per_page: PerPage = 25,
     ) -> list[Person]:
         """Get all people."""
@@ -106,6 +106,7 @@ class NotesParams(TypedDict, total=False):
 
 
 type PlanNoteInclude = Literal["plan_note_category"]
+type PlanNoteOrder = Literal["created_at", "updated_at", "-created_at", "-updated_at"]
 
 
 class Notes(Endpoint[PlanNote]):
@@ -124,13 +125,7 @@ class Notes(Endpoint[PlanNote]):
         self,
         *,
         include: PlanNoteInclude | None = None,
-        order: Literal[
-            "created_at",
-            "updated_at",
-            "-created_at",
-            "-updated_at",
-        ]
-        | None = None,
+        order: PlanNoteOrder | None = None,
         per_page: PerPage = 25,
     ) -> list[PlanNote]:
         """Get all plan notes."""
@@ -154,6 +149,20 @@ class Notes(Endpoint[PlanNote]):
         """Create a plan note."""
 
 
+type PlanInclude = Literal["contributors", "my_schedules", "plan_times", "series"]
+type PlanOrder = Literal[
+    "created_at",
+    "sort_date",
+    "title",
+    "updated_at",
+    "-created_at",
+    "-sort_date",
+    "-title",
+    "-updated_at",
+]
+type PlanFilter = Literal["future", "no_dates", "past"]
+
+
 class Plans(Endpoint[Plan]):
     """Plan endpoint."""
 
@@ -162,24 +171,8 @@ class Plans(Endpoint[Plan]):
         plan_id: int,
         /,
         *,
-        include: Literal[
-            "contributors",
-            "my_schedules",
-            "plan_times",
-            "series",
-        ]
-        | None = None,
-        order: Literal[
-            "created_at",
-            "sort_date",
-            "title",
-            "updated_at",
-            "-created_at",
-            "-sort_date",
-            "-title",
-            "-updated_at",
-        ]
-        | None = None,
+        include: PlanInclude | None = None,
+        order: PlanOrder | None = None,
         created_at: datetime.datetime | None = None,
         series_title: str | None = None,
         title: str | None = None,
@@ -190,29 +183,13 @@ class Plans(Endpoint[Plan]):
     def list_all(
         self,
         *,
-        include: Literal[
-            "contributors",
-            "my_schedules",
-            "plan_times",
-            "series",
-        ]
-        | None = None,
-        order: Literal[
-            "created_at",
-            "sort_date",
-            "title",
-            "updated_at",
-            "-created_at",
-            "-sort_date",
-            "-title",
-            "-updated_at",
-        ]
-        | None = None,
+        include: PlanInclude | None = None,
+        order: PlanOrder | None = None,
         created_at: datetime.datetime | None = None,
         series_title: str | None = None,
         title: str | None = None,
         updated_at: datetime.datetime | None = None,
-        filter: Literal["future", "no_dates", "past"] | None = None,
+        filter: PlanFilter | None = None,
         per_page: PerPage = 25,
     ) -> list[Plan]:
         """Get all plans."""
@@ -266,6 +243,8 @@ class PlanTemplates(Endpoint[PlanTemplate]):
 
 
 type PlanTimeInclude = Literal["split_team_rehearsal_assignments"]
+type PlanTimeOrder = Literal["starts_at", "-starts_at"]
+type PlanTimeFilter = Literal["future", "past", "named"]
 
 
 class PlanTimesParams(TypedDict, total=False):
@@ -295,10 +274,10 @@ class PlanTimes(Endpoint[PlanTime]):
         self,
         *,
         include: PlanTimeInclude | None = None,
-        order: Literal["starts_at", "-starts_at"] | None = None,
+        order: PlanTimeOrder | None = None,
         time_type: TimeType | None = None,
         per_page: PerPage = 25,
-        filter: Literal["future", "past", "named"] | None = None,
+        filter: PlanTimeFilter | None = None,
     ) -> list[PlanTime]:
         """Get plan times for a service type."""
 
@@ -322,6 +301,12 @@ type PersonTeamPositionAssignmentInclude = (
     PersonTeamPositionAssignmentIncludeValues
     | list[PersonTeamPositionAssignmentIncludeValues]
 )
+type PersonTeamPositionAssignmentOrder = Literal[
+    "first_name",
+    "last_name",
+    "-first_name",
+    "-last_name",
+]
 
 
 class PersonTeamPositionAssignments(Endpoint[PersonTeamPositionAssignment]):
@@ -340,13 +325,7 @@ class PersonTeamPositionAssignments(Endpoint[PersonTeamPositionAssignment]):
         self,
         *,
         include: PersonTeamPositionAssignmentInclude | None = None,
-        order: Literal[
-            "first_name",
-            "last_name",
-            "-first_name",
-            "-last_name",
-        ]
-        | None = None,
+        order: PersonTeamPositionAssignmentOrder | None = None,
         per_page: PerPage = 25,
     ) -> list[PersonTeamPositionAssignment]:
         """List all person team positions."""
@@ -377,6 +356,7 @@ class PersonTeamPositionAssignments(Endpoint[PersonTeamPositionAssignment]):
 
 
 type TeamPositionInclude = Literal["tags", "team"]
+type TeamPositionOrder = Literal["name", "-name"]
 
 
 class TeamPositions(Endpoint[TeamPosition]):
@@ -395,7 +375,7 @@ class TeamPositions(Endpoint[TeamPosition]):
         self,
         *,
         include: TeamPositionInclude | None = None,
-        order: Literal["name", "-name"] | None = None,
+        order: TeamPositionOrder | None = None,
         per_page: PerPage = 25,
     ) -> list[TeamPosition]:
         """List all team positions."""
@@ -418,6 +398,7 @@ class TimePreferenceOptions(Endpoint[TimePreferenceOption]):
 
 
 type ServiceTypeInclude = Literal["time_preference_options"]
+type ServiceTypeOrder = Literal["name", "sequence", "-name", "-sequence"]
 
 
 class ServiceTypes(Endpoint[ServiceType]):
@@ -436,7 +417,7 @@ class ServiceTypes(Endpoint[ServiceType]):
         self,
         *,
         include: ServiceTypeInclude | None = None,
-        order: Literal["name", "sequence", "-name", "-sequence"] | None = None,
+        order: ServiceTypeOrder | None = None,
         per_page: PerPage = 25,
         name: str | None = None,
     ) -> list[ServiceType]:
@@ -8,6 +8,16 @@ from ..base import Endpoint, PerPage
 from .models import Team, TeamInclude
 
 
+type TeamOrder = Literal[
+    "created_at",
+    "name",
+    "updated_at",
+    "-created_at",
+    "-name",
+    "-updated_at",
+]
+
+
 class Teams(Endpoint[Team]):
     """Teams endpoint."""
 
@@ -24,15 +34,7 @@ class Teams(Endpoint[Team]):
         self,
         *,
         include: TeamInclude | None = None,
-        order: Literal[
-            "created_at",
-            "name",
-            "updated_at",
-            "-created_at",
-            "-name",
-            "-updated_at",
-        ]
-        | None = None,
+        order: TeamOrder | None = None,
         name: str | None = None,
         per_page: PerPage = 25,
     ) -> list[Team]: